@@ -67,8 +67,7 @@ def power(base, exponent):
     Returns:
         base raised to the exponent power
     """
-    import math
-    return math.pow(base, exponent)
+    return base ** exponent
 
 
 def calculate_average(numbers):
@@ -87,10 +86,7 @@ def calculate_average(numbers):
     if not numbers:
         raise ValueError("Cannot calculate average of empty list")
     
-    total = sum(numbers)
-    count = len(numbers)
-    average = total / count
-    return average
+    return sum(numbers) / len(numbers)
 
 
 def greet(name):
@@ -116,7 +112,20 @@ def is_palindrome(text):
     Returns:
         True if the text is a palindrome, False otherwise
     """
-    cleaned_text = text.lower().replace(" ", "")
-    
-    reversed_text = cleaned_text[::-1]
-    return cleaned_text == reversed_text 
\ No newline at end of file
+    # Walk inwards from both ends, skipping spaces, so no copies are made
+    # and mismatches stop the scan early
+    i, j = 0, len(text) - 1
+    while i < j:
+        left = text[i]
+        if left == " ":
+            i += 1
+            continue
+        right = text[j]
+        if right == " ":
+            j -= 1
+            continue
+        if left.lower() != right.lower():
+            return False
+        i += 1
+        j -= 1
+    return True 
\ No newline at end of file
@@ -5,13 +5,28 @@ This file demonstrates class inheritance structures
 to test DiffScope's ability to detect changes in class hierarchies.
 """
 
+import sys
 from abc import ABC, abstractmethod
+from enum import IntFlag
 from typing import List, Dict, Any, Optional, Union, Set
 
 
+class Permission(IntFlag):
+    """Permissions that can be granted to a user, combinable as a bitmask."""
+    
+    CREATE_USER = 1
+    DELETE_USER = 2
+    EDIT_RESOURCE = 4
+    MANAGE_ROLES = 8
+    VIEW_LOGS = 16
+    SYSTEM_CONFIG = 32
+
+
 class Entity:
     """Base class for all entities in the system."""
     
+    __slots__ = ("id", "name", "tags", "created_at")
+    
     def __init__(self, id: str, name: str):
         self.id = id
         self.name = name
@@ -44,6 +59,8 @@ class Entity:
 class Searchable(ABC):
     """Interface for objects that can be searched."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_search_terms(self) -> List[str]:
         """Get search terms for this object."""
@@ -53,6 +70,8 @@ class Searchable(ABC):
 class Printable(ABC):
     """Interface for objects that can be printed."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def to_printable_format(self) -> str:
         """Convert to a printable format."""
@@ -68,6 +87,8 @@ class Printable(ABC):
 class Named(ABC):
     """Interface for objects that have a name attribute."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_display_name(self) -> str:
         """Get the display name for this object."""
@@ -78,20 +99,22 @@ class Named(ABC):
 class User(Entity, Named, Searchable):  # Added Searchable
     """Represents a user in the system."""
     
+    __slots__ = ("email", "role", "permissions", "last_login")
+    
     def __init__(self, id: str, name: str, email: str, role: str = "standard"):
         super().__init__(id, name)
         self.email = email
         self.role = role
-        self.permissions = set()
+        self.permissions = Permission(0)
         self.last_login = None  # New field
         
-    def add_permission(self, permission: str) -> None:
+    def add_permission(self, permission: Permission) -> None:
         """Add a permission to this user."""
-        self.permissions.add(permission)
+        self.permissions |= permission
         
-    def has_permission(self, permission: str) -> bool:
-        """Check if this user has the specified permission."""
-        return permission in self.permissions
+    def has_permission(self, permission: Permission) -> bool:
+        """Check if this user has all of the specified permissions."""
+        return self.permissions & permission == permission
     
     def get_display_name(self) -> str:
         """Get the display name for this user."""
@@ -107,6 +130,8 @@ class User(Entity, Named, Searchable):  # Added Searchable
 class BaseResource(Entity):
     """Base class for all resources."""
     
+    __slots__ = ("owner_id", "data")
+    
     def __init__(self, id: str, name: str, owner_id: str):
         super().__init__(id, name)
         self.owner_id = owner_id
@@ -125,9 +150,17 @@ class BaseResource(Entity):
 class Resource(BaseResource, Named, Printable, Searchable):  # Changed to extend BaseResource, added Searchable
     """Represents a resource in the system."""
     
+    __slots__ = ("resource_type",)
+    
     def __init__(self, id: str, name: str, owner_id: str, resource_type: str):
-        super().__init__(id, name, owner_id)
-        self.resource_type = resource_type
+        # Inline BaseResource.__init__ to skip a level of super() dispatch;
+        # none of the bases cooperate through super().__init__
+        Entity.__init__(self, id, name)
+        self.owner_id = owner_id
+        self.data = {}
+        # Resource types come from a small vocabulary; intern them so
+        # comparisons and hashing hit the identity fast path
+        self.resource_type = sys.intern(resource_type)
         
     def get_display_name(self) -> str:
         """Get the display name for this resource."""
@@ -151,6 +184,8 @@ class Resource(BaseResource, Named, Printable, Searchable):  # Changed to extend
 class Document(Resource):
     """Represents a document resource."""
     
+    __slots__ = ("content", "version")
+    
     def __init__(self, id: str, name: str, owner_id: str, content: str = ""):
         super().__init__(id, name, owner_id, "document")
         self.content = content
@@ -180,15 +215,15 @@ class Document(Resource):
     # Override search terms
     def get_search_terms(self) -> List[str]:
         """Get search terms for this document."""
-        terms = super().get_search_terms()
         # Add content as search term
-        terms.append(self.content)
-        return terms
+        return [*super().get_search_terms(), self.content]
 
 
 class Image(Resource):
     """Represents an image resource."""
     
+    __slots__ = ("width", "height", "format")
+    
     def __init__(self, id: str, name: str, owner_id: str, width: int, height: int, format: str = "png"):
         super().__init__(id, name, owner_id, "image")
         self.width = width
@@ -217,6 +252,8 @@ class Image(Resource):
 class GuestUser(User):
     """Represents a guest user with limited permissions."""
     
+    __slots__ = ()
+    
     def __init__(self, id: str, name: str = "Guest"):
         super().__init__(id, name, f"guest_{id}@example.com", role="guest")
     
@@ -229,25 +266,30 @@ class GuestUser(User):
 class AdminUser(User):
     """Represents an admin user with extended permissions."""
     
+    __slots__ = ("admin_level",)
+    
     def __init__(self, id: str, name: str, email: str, admin_level: int = 1):  # Added admin_level
         super().__init__(id, name, email, role="admin")
         self.admin_level = admin_level  # New field
+        # Resolve the bound method once for the run of grants below
+        add_permission = self.add_permission
+        
         # Default admin permissions
-        self.add_permission("create_user")
-        self.add_permission("delete_user")
-        self.add_permission("edit_resource")
+        add_permission(Permission.CREATE_USER)
+        add_permission(Permission.DELETE_USER)
+        add_permission(Permission.EDIT_RESOURCE)
         
         # Higher level admins get more permissions
         if admin_level >= 2:
-            self.add_permission("manage_roles")
-            self.add_permission("view_logs")
+            add_permission(Permission.MANAGE_ROLES)
+            add_permission(Permission.VIEW_LOGS)
         
         if admin_level >= 3:
-            self.add_permission("system_config")
+            add_permission(Permission.SYSTEM_CONFIG)
         
     def can_manage_users(self) -> bool:
         """Check if this admin can manage users."""
-        return self.has_permission("create_user") and self.has_permission("delete_user")
+        return self.has_permission(Permission.CREATE_USER | Permission.DELETE_USER)
         
     def get_display_name(self) -> str:
         """Get the display name for this admin."""
@@ -278,16 +320,30 @@ if __name__ == "__main__":
     
     # Demonstrate hierarchy
     entities = [admin, user, guest, doc, img]
+    
+    # Resolve interface membership once per concrete class instead of
+    # running the ABC isinstance checks for every entity
+    interfaces = {}
+    for entity in entities:
+        entity_type = type(entity)
+        if entity_type not in interfaces:
+            interfaces[entity_type] = (
+                issubclass(entity_type, Named),
+                issubclass(entity_type, Printable),
+                issubclass(entity_type, Searchable),
+            )
+    
     for entity in entities:
+        is_named, is_printable, is_searchable = interfaces[type(entity)]
         print(f"\n{entity}")
         
-        if isinstance(entity, Named):
+        if is_named:
             print(f"Display name: {entity.get_display_name()}")
             
-        if isinstance(entity, Printable):
+        if is_printable:
             print(f"Printable format:\n{entity.to_printable_format()}")
             
-        if isinstance(entity, Searchable):
+        if is_searchable:
             print(f"Search terms: {', '.join(entity.get_search_terms())}")
             
         print(f"Tags: {', '.join(entity.tags)}") 
\ No newline at end of file
@@ -6,10 +6,49 @@ to test the function change detection capabilities of DiffScope.
 """
 
 import re
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple, Any, Set, Union
 import math
+import sys
+import time
 import datetime
+import functools
 import logging
+import operator
+
+
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.ASCII)
+
+# Numeric layouts that parse_date can decode without probing strptime
+DATE_PATTERN = re.compile(
+    r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+    r"(?:[ T](?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2}))?"
+    r"|(?P<dmy_day>\d{1,2})/(?P<dmy_month>\d{1,2})/(?P<dmy_year>\d{4})",
+    re.ASCII,
+)
+
+# strptime formats tried by parse_date, in order of precedence
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d-%b-%Y",
+    "%Y/%m/%d",
+    "%B %d, %Y",
+    "%d %B %Y",
+)
+
+# Punctuation each format requires literally; strptime cannot succeed on a
+# string missing any of it, so parse_date skips those formats outright.
+# Letters and whitespace are excluded since strptime matches them loosely.
+DATE_FORMAT_LITERALS = tuple(
+    (fmt, frozenset(c for c in re.sub(r"%.", "", fmt) if not c.isalnum() and not c.isspace()))
+    for fmt in DATE_FORMATS
+)
 
 
 def fibonacci(n: int) -> List[int]:
@@ -22,20 +61,50 @@ def fibonacci(n: int) -> List[int]:
     Returns:
         List containing the Fibonacci sequence
     """
-    # Added more efficient implementation with memoization
-    memo = {0: 0, 1: 1}
-    
-    def fib_memo(k: int) -> int:
-        if k not in memo:
-            memo[k] = fib_memo(k-1) + fib_memo(k-2)
-        return memo[k]
-    
     if n <= 0:
         return []
     if n == 1:
         return [0]
     
-    return [fib_memo(i) for i in range(n)]
+    # Fill a preallocated list in a single linear pass, carrying the last
+    # two terms in locals rather than re-reading them from the list
+    sequence = [0] * n
+    a, b = 0, 1
+    for i in range(n):
+        sequence[i] = a
+        a, b = b, a + b
+    
+    return sequence
+
+
+def fib_nth(n: int) -> int:
+    """
+    Calculate the n-th Fibonacci number using fast doubling.
+    
+    Args:
+        n: Zero-based index of the Fibonacci number
+        
+    Returns:
+        The n-th Fibonacci number
+        
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    
+    # Walk the bits of n from the most significant end, keeping
+    # (F(k), F(k+1)) and doubling k at each step
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    
+    return a
 
 
 def parse_date(date_string: str) -> Optional[datetime.datetime]:
@@ -48,30 +117,50 @@ def parse_date(date_string: str) -> Optional[datetime.datetime]:
     Returns:
         Datetime object or None if parsing fails
     """
-    # Added more formats and error logging
-    formats = [
-        "%Y-%m-%d",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-        "%d-%b-%Y",
-        "%Y/%m/%d",
-        "%B %d, %Y",
-        "%d %B %Y",
-    ]
+    # Warn here rather than in the cached parser, so every failed call is
+    # reported, not just the first one for each string
+    parsed = _parse_date_cached(date_string)
+    if parsed is None:
+        logger.warning("Could not parse date from string: %s", date_string)
+    return parsed
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_cached(date_string: str) -> Optional[datetime.datetime]:
+    """Parse a date string, memoizing the result per input string."""
+    # Decode the common numeric layouts in one regex match; anything else,
+    # including month-first dates, falls through to the strptime loop
+    match = DATE_PATTERN.fullmatch(date_string)
+    if match:
+        try:
+            if match.group("year"):
+                return datetime.datetime(
+                    int(match.group("year")),
+                    int(match.group("month")),
+                    int(match.group("day")),
+                    int(match.group("hour") or 0),
+                    int(match.group("minute") or 0),
+                    int(match.group("second") or 0),
+                )
+            return datetime.datetime(
+                int(match.group("dmy_year")),
+                int(match.group("dmy_month")),
+                int(match.group("dmy_day")),
+            )
+        except ValueError:
+            pass
     
-    # Add logging for parsing attempts
-    logger = logging.getLogger(__name__)
+    present = set(date_string)
     
-    for fmt in formats:
+    for fmt, literals in DATE_FORMAT_LITERALS:
+        if not literals <= present:
+            continue
         try:
             return datetime.datetime.strptime(date_string, fmt)
         except ValueError:
-            logger.debug(f"Failed to parse {date_string} with format {fmt}")
+            logger.debug("Failed to parse %s with format %s", date_string, fmt)
             continue
     
-    logger.warning(f"Could not parse date from string: {date_string}")
     return None
 
 
@@ -86,19 +175,16 @@ def extract_emails(text: str) -> List[str]:
         List of email addresses found
     """
     # Improved regex pattern and added deduplication
-    pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    emails = re.findall(pattern, text)
+    emails = EMAIL_PATTERN.findall(text)
     
-    # Remove duplicates while preserving order
-    unique_emails = []
-    seen = set()
+    # Remove duplicates while preserving order; the dict keeps the first
+    # spelling seen for each case-folded address
+    unique_emails = {}
     
     for email in emails:
-        if email.lower() not in seen:
-            seen.add(email.lower())
-            unique_emails.append(email)
+        unique_emails.setdefault(email.lower(), email)
     
-    return unique_emails
+    return list(unique_emails.values())
 
 
 class DataProcessor:
@@ -130,26 +216,28 @@ class DataProcessor:
             Filtered list of dictionaries
         """
         # Added handling for case sensitivity and special value handling
-        result = []
+        # Interned query strings compare by identity against interned values
+        if type(value) is str:
+            value = sys.intern(value)
         
-        for item in self.data:
-            if key not in item:
-                continue
-                
-            item_value = item.get(key)
+        # The query value is fixed for the whole scan, so pick the
+        # comparison once instead of re-checking its type on every row
+        if isinstance(value, str) and not self.case_sensitive:
+            value_lower = value.lower()
             
-            # Handle string comparison with case sensitivity option
-            if isinstance(item_value, str) and isinstance(value, str) and not self.case_sensitive:
-                if item_value.lower() == value.lower():
-                    result.append(item)
-            # Handle list/set membership tests
-            elif isinstance(value, (list, set)) and item_value in value:
-                result.append(item)
-            # Normal equality check
-            elif item_value == value:
-                result.append(item)
-                
-        return result
+            def matches(item_value):
+                if isinstance(item_value, str):
+                    return item_value.lower() == value_lower
+                return item_value == value
+        # Handle list/set membership tests
+        elif isinstance(value, (list, set)):
+            def matches(item_value):
+                return item_value in value or item_value == value
+        # Normal equality check needs no per-row helper call
+        else:
+            return [item for item in self.data if key in item and item[key] == value]
+        
+        return [item for item in self.data if key in item and matches(item[key])]
     
     def sort_data(self, key: str, reverse: bool = False) -> List[Dict]:
         """
@@ -162,12 +250,16 @@ class DataProcessor:
         Returns:
             Sorted list of dictionaries
         """
-        # Added handling for missing keys
-        def get_sort_key(item):
-            # Return a default value for missing keys
-            return item.get(key, None)
-            
-        return sorted(self.data, key=get_sort_key, reverse=reverse)
+        # itemgetter is the cheapest key when every item has the key; sorted()
+        # extracts all keys before comparing, so a miss fails fast
+        try:
+            return sorted(self.data, key=operator.itemgetter(key), reverse=reverse)
+        except KeyError:
+            pass
+        
+        # Added handling for missing keys; methodcaller calls item.get(key)
+        # from C, so missing keys still sort as None
+        return sorted(self.data, key=operator.methodcaller("get", key), reverse=reverse)
     
     def aggregate_data(self, group_by: str, aggregate_field: str, agg_function: str = 'list') -> Dict[Any, Union[List, float]]:
         """
@@ -182,52 +274,81 @@ class DataProcessor:
             Dictionary with groups as keys and aggregated values
         """
         # Added multiple aggregation functions
-        result = {}
+        combine = {
+            'sum': operator.add,
+            'avg': operator.add,
+            'min': min,
+            'max': max,
+        }.get(agg_function)
+        
+        if combine is not None:
+            # Reduce while grouping so no per-group value lists are built
+            result = {}
+            counts = defaultdict(int)
+            
+            for item in self.data:
+                key = item.get(group_by)
+                value = item.get(aggregate_field)
+                
+                if value is None:
+                    # Groups without any values still appear, as None
+                    result.setdefault(key, None)
+                    continue
+                
+                current = result.get(key)
+                if current is None:
+                    # Start sums from 0 to match the built-in sum()
+                    result[key] = 0 + value if combine is operator.add else value
+                else:
+                    result[key] = combine(current, value)
+                counts[key] += 1
+            
+            if agg_function == 'avg':
+                for key, count in counts.items():
+                    result[key] /= count
+            
+            return result
+        
+        groups = defaultdict(list)
         
         for item in self.data:
-            key = item.get(group_by)
+            # Touch the group even when the value is missing so it still
+            # appears in the result
+            values = groups[item.get(group_by)]
             value = item.get(aggregate_field)
             
-            if key not in result:
-                result[key] = []
-            
             if value is not None:
-                result[key].append(value)
+                values.append(value)
         
-        # Apply aggregation function if not 'list'
+        result = dict(groups)
+        
+        # Unknown aggregation functions keep the value lists, with empty
+        # groups reported as None
         if agg_function != 'list':
             for key, values in result.items():
                 if not values:
                     result[key] = None
-                elif agg_function == 'sum':
-                    result[key] = sum(values)
-                elif agg_function == 'avg':
-                    result[key] = sum(values) / len(values)
-                elif agg_function == 'min':
-                    result[key] = min(values)
-                elif agg_function == 'max':
-                    result[key] = max(values)
         
         return result
     
     def process(self) -> None:
         """Process the data and mark as processed."""
         # Added processing logic and timing
-        start_time = datetime.datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # Perform some processing - e.g., removing duplicates
         seen = set()
         self.processed_data = []
         
         for item in self.data:
-            # Convert dict to a hashable tuple of items
-            item_tuple = tuple(sorted(item.items()))
-            if item_tuple not in seen:
-                seen.add(item_tuple)
+            # Convert dict to an order-independent hashable set of items
+            item_key = frozenset(item.items())
+            if item_key not in seen:
+                seen.add(item_key)
                 self.processed_data.append(item)
                 
         self.processed = True
-        self.processing_time = (datetime.datetime.now() - start_time).total_seconds()
+        self.processing_time = (time.perf_counter_ns() - start_ns) / 1e9
 
 
 def calculate_statistics(numbers: List[float]) -> Dict[str, float]:
@@ -253,24 +374,27 @@ def calculate_statistics(numbers: List[float]) -> Dict[str, float]:
             "range": 0,
         }
     
+    n = len(numbers)
+    total = sum(numbers)
+    
     # Calculate mean
-    mean = sum(numbers) / len(numbers)
+    mean = total / n
     
     # Calculate median
     sorted_numbers = sorted(numbers)
-    n = len(sorted_numbers)
+    half = n // 2
     if n % 2 == 0:
-        median = (sorted_numbers[n//2 - 1] + sorted_numbers[n//2]) / 2
+        median = (sorted_numbers[half - 1] + sorted_numbers[half]) / 2
     else:
-        median = sorted_numbers[n//2]
+        median = sorted_numbers[half]
     
     # Calculate standard deviation
-    variance = sum((x - mean) ** 2 for x in numbers) / len(numbers)
+    variance = sum((x - mean) ** 2 for x in numbers) / n
     std_dev = math.sqrt(variance)
     
-    # Calculate additional statistics
-    min_val = min(numbers)
-    max_val = max(numbers)
+    # Calculate additional statistics from the already sorted copy
+    min_val = sorted_numbers[0]
+    max_val = sorted_numbers[-1]
     value_range = max_val - min_val
     
     return {
@@ -279,7 +403,7 @@ def calculate_statistics(numbers: List[float]) -> Dict[str, float]:
         "std_dev": std_dev,
         "min": min_val,
         "max": max_val,
-        "count": len(numbers),
-        "sum": sum(numbers),
+        "count": n,
+        "sum": total,
         "range": value_range,
     } 
\ No newline at end of file
@@ -50,7 +50,7 @@ def create_multiplier(factor):
     return lambda x: x * factor
 
 
-# Function using map with lambda
+# Function using a comprehension in place of map with lambda
 def square_all(numbers):
     """
     Square all numbers in a list.
@@ -61,10 +61,10 @@ def square_all(numbers):
     Returns:
         List of squared numbers
     """
-    return list(map(lambda x: x**2, numbers))
+    return [x * x for x in numbers]
 
 
-# Function using filter with lambda
+# Function using a comprehension in place of filter with lambda
 def filter_positive(numbers):
     """
     Filter positive numbers from a list.
@@ -75,7 +75,7 @@ def filter_positive(numbers):
     Returns:
         List of positive numbers
     """
-    return list(filter(lambda x: x > 0, numbers))
+    return [x for x in numbers if x > 0]
 
 
 # Function using sorted with lambda
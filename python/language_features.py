@@ -8,11 +8,18 @@ in these language constructs.
 """
 
 import functools
+import math
 import time
 import logging
 from typing import List, Dict, Any, Callable, Generator, Optional
 
 
+# Sentinels used by memoize for cache misses and to separate keyword
+# arguments from positional ones in cache keys
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
 # ----- Decorators -----
 
 def log_execution(func):
@@ -68,12 +75,19 @@ def memoize(func):
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Convert kwargs to frozenset for hashability
-        key = (args, frozenset(kwargs.items()))
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
+        # Plain positional calls key on args directly; keyword arguments are
+        # appended in name order after a marker so calls cannot collide
+        if kwargs:
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+        else:
+            key = args
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = cache[key] = func(*args, **kwargs)
+        return result
     
+    # Expose the cache for introspection and clearing
+    wrapper.cache = cache
     return wrapper
 
 
@@ -176,12 +190,12 @@ class Timer:
     
     def __enter__(self):
         """Start the timer."""
-        self.start = time.time()
+        self.start = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop the timer and print the elapsed time."""
-        self.end = time.time()
+        self.end = time.perf_counter()
         self.elapsed = self.end - self.start
         print(f"Elapsed time: {self.elapsed:.4f} seconds")
 
@@ -363,7 +377,13 @@ def factorial(n):
     """Calculate factorial with memoization."""
     if n <= 1:
         return 1
-    return n * factorial(n-1)
+    if not isinstance(n, int):
+        # math.factorial rejects non-integers such as 5.0; keep the
+        # recursive definition, and its float result, for those
+        return n * factorial(n - 1)
+    # math.factorial loops in C, so cold calls no longer recurse a frame
+    # per level
+    return math.factorial(n)
 
 
 @decorator_with_arguments(prefix="<", suffix=">")
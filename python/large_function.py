@@ -8,9 +8,16 @@ to test DiffScope's ability to detect function extraction and composition.
 import os
 import json
 import csv
+import functools
 import math
-import statistics
-from typing import List, Dict, Any, Optional, Union, Tuple
+from collections import Counter
+from itertools import chain
+from types import CodeType
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable
+
+
+# 1 MiB read buffer for input files
+READ_BUFFER_SIZE = 1 << 20
 
 
 def validate_inputs(input_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,13 +57,11 @@ def read_csv_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
     Returns:
         Tuple of (data, warnings)
     """
-    data = []
     warnings = []
     
-    with open(file_path, 'r', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            data.append(row)
+    # Let list() drain the reader in C rather than appending row by row
+    with open(file_path, 'r', newline='', buffering=READ_BUFFER_SIZE) as csvfile:
+        data = list(csv.DictReader(csvfile))
             
     return data, warnings
 
@@ -71,7 +76,7 @@ def read_json_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
     Returns:
         Tuple of (data, warnings)
     """
-    with open(file_path, 'r') as jsonfile:
+    with open(file_path, 'r', buffering=READ_BUFFER_SIZE) as jsonfile:
         data = json.load(jsonfile)
         
     # Ensure data is a list
@@ -94,20 +99,32 @@ def read_txt_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
     data = []
     warnings = []
     
-    with open(file_path, 'r') as txtfile:
-        lines = txtfile.readlines()
-        header = lines[0].strip().split(',')
-        for line in lines[1:]:
-            values = line.strip().split(',')
-            if len(values) == len(header):
-                row = {header[i]: values[i] for i in range(len(header))}
-                data.append(row)
+    with open(file_path, 'r', buffering=READ_BUFFER_SIZE) as txtfile:
+        header_line = txtfile.readline()
+        if not header_line:
+            raise ValueError("TXT file is empty")
+        header = header_line.strip().split(',')
+        column_count = len(header)
+        
+        for line in txtfile:
+            line = line.strip()
+            values = line.split(',')
+            if len(values) == column_count:
+                data.append(dict(zip(header, values)))
             else:
-                warnings.append(f"Skipped malformed line: {line.strip()}")
+                warnings.append(f"Skipped malformed line: {line}")
                 
     return data, warnings
 
 
+# (reader, file type) for each supported extension
+FILE_READERS = {
+    '.csv': (read_csv_file, "csv"),
+    '.json': (read_json_file, "json"),
+    '.txt': (read_txt_file, "txt"),
+}
+
+
 def read_input_file(input_path: str) -> Tuple[List[Dict[str, Any]], str, List[str]]:
     """
     Read and parse input file based on extension.
@@ -122,17 +139,11 @@ def read_input_file(input_path: str) -> Tuple[List[Dict[str, Any]], str, List[st
     extension = extension.lower()
     
     try:
-        if extension == '.csv':
-            data, warnings = read_csv_file(input_path)
-            file_type = "csv"
-        elif extension == '.json':
-            data, warnings = read_json_file(input_path)
-            file_type = "json"
-        elif extension == '.txt':
-            data, warnings = read_txt_file(input_path)
-            file_type = "txt"
-        else:
+        if extension not in FILE_READERS:
             raise ValueError(f"Unsupported file extension: {extension}")
+        
+        reader, file_type = FILE_READERS[extension]
+        data, warnings = reader(input_path)
             
         return data, file_type, warnings
     except Exception as e:
@@ -153,68 +164,129 @@ def apply_column_mapping(data: List[Dict[str, Any]], mapping: Dict[str, str]) ->
     if not mapping:
         return data
         
+    mapping_items = tuple(mapping.items())
+    
+    # Rows from one source normally share the same keys, so the renaming
+    # plan is worked out once per distinct key layout rather than per row
+    layout = None
     mapped_data = []
     for item in data:
-        mapped_item = {}
-        for old_key, new_key in mapping.items():
-            if old_key in item:
-                mapped_item[new_key] = item[old_key]
-        
-        # Copy unmapped fields
-        for k, v in item.items():
-            if k not in mapping:
-                mapped_item[k] = v
-                
-        mapped_data.append(mapped_item)
+        keys = tuple(item)
+        if keys != layout:
+            layout = keys
+            source_keys = [old_key for old_key, _ in mapping_items if old_key in item]
+            target_keys = [new_key for old_key, new_key in mapping_items if old_key in item]
+            
+            # Copy unmapped fields
+            unmapped_keys = [k for k in keys if k not in mapping]
+            source_keys += unmapped_keys
+            target_keys += unmapped_keys
+        
+        mapped_data.append(dict(zip(target_keys, map(item.__getitem__, source_keys))))
         
     return mapped_data
 
 
-def check_filter_criteria(item: Dict[str, Any], filter_criteria: Dict[str, Any]) -> bool:
+def convert_value_if_numeric(value: Any) -> Any:
     """
-    Check if an item matches filter criteria.
+    Convert string value to numeric if possible.
     
     Args:
-        item: Data item to check
-        filter_criteria: Filter criteria dictionary
+        value: Value to convert
         
     Returns:
-        True if item matches criteria, False otherwise
+        Converted value or original value
     """
-    for field, criteria in filter_criteria.items():
-        if field not in item:
-            return False
+    try:
+        if isinstance(value, str) and value.replace('.', '', 1).isdigit():
+            return float(value) if '.' in value else int(value)
+    except ValueError:
+        pass
+    
+    return value
+
+
+# Source of the test that rejects a value for each supported operator;
+# {} stands for the operand's name in the generated predicate
+CRITERIA_REJECTIONS = (
+    ("eq", "value != {}"),
+    ("ne", "value == {}"),
+    ("gt", "not (isinstance(value, (int, float)) and value > {})"),
+    ("lt", "not (isinstance(value, (int, float)) and value < {})"),
+    ("in", "value not in {}"),
+    ("contains", "not (isinstance(value, str) and {} in value)"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_predicate_shape(shape: Tuple[Optional[Tuple[str, ...]], ...]) -> CodeType:
+    """
+    Compile a filter predicate for the given operators per field.
+    
+    Args:
+        shape: Configured operators for each field, or None for equality
+        
+    Returns:
+        Code object defining predicate(item)
+    """
+    lines = ["def predicate(item):"]
+    
+    for index, operators in enumerate(shape):
+        lines.append(f"    if field_{index} not in item:")
+        lines.append("        return False")
+        lines.append(f"    value = convert_value_if_numeric(item[field_{index}])")
+        
+        if operators is None:
+            rejections = [f"value != expected_{index}"]
+        else:
+            rejections = [
+                template.format(f"{operator}_{index}")
+                for operator, template in CRITERIA_REJECTIONS
+                if operator in operators
+            ]
             
-        value = item[field]
+        for rejection in rejections:
+            lines.append(f"    if {rejection}:")
+            lines.append("        return False")
+            
+    lines.append("    return True")
+    
+    return compile("\n".join(lines), "<filter_criteria>", "exec")
+
+
+def compile_filter_criteria(filter_criteria: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile filter criteria into a predicate specialised for their shape.
+    
+    An item matches when it has every field and each field's value, after
+    convert_value_if_numeric, passes all of that field's criteria. Fields
+    and operands are passed to the generated code as globals, never as
+    source text.
+    
+    Args:
+        filter_criteria: Filter criteria dictionary
         
-        # Try to convert numeric strings to numbers for comparison
-        try:
-            if isinstance(value, str) and (value.isdigit() or 
-                                          (value.replace('.', '', 1).isdigit() and value.count('.') <= 1)):
-                value = float(value) if '.' in value else int(value)
-        except ValueError:
-            pass
+    Returns:
+        Function returning True if an item matches the criteria
+    """
+    namespace = {"convert_value_if_numeric": convert_value_if_numeric}
+    shape = []
+    
+    for index, (field, criteria) in enumerate(filter_criteria.items()):
+        namespace[f"field_{index}"] = field
         
-        # Apply different types of criteria
         if isinstance(criteria, dict):
-            if "eq" in criteria and value != criteria["eq"]:
-                return False
-            if "ne" in criteria and value == criteria["ne"]:
-                return False
-            if "gt" in criteria and not (isinstance(value, (int, float)) and value > criteria["gt"]):
-                return False
-            if "lt" in criteria and not (isinstance(value, (int, float)) and value < criteria["lt"]):
-                return False
-            if "in" in criteria and value not in criteria["in"]:
-                return False
-            if "contains" in criteria and not (isinstance(value, str) and criteria["contains"] in value):
-                return False
+            operators = tuple(operator for operator, _ in CRITERIA_REJECTIONS if operator in criteria)
+            for operator in operators:
+                namespace[f"{operator}_{index}"] = criteria[operator]
         else:
-            # Simple equality check
-            if value != criteria:
-                return False
-                
-    return True
+            operators = None
+            namespace[f"expected_{index}"] = criteria
+            
+        shape.append(operators)
+    
+    exec(compile_predicate_shape(tuple(shape)), namespace)
+    return namespace["predicate"]
 
 
 def apply_filtering(data: List[Dict[str, Any]], filter_criteria: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
@@ -231,10 +303,7 @@ def apply_filtering(data: List[Dict[str, Any]], filter_criteria: Dict[str, Any])
     if not filter_criteria:
         return data, {}
         
-    filtered_data = []
-    for item in data:
-        if check_filter_criteria(item, filter_criteria):
-            filtered_data.append(item)
+    filtered_data = list(filter(compile_filter_criteria(filter_criteria), data))
             
     filter_stats = {
         "filtered_count": len(filtered_data),
@@ -257,20 +326,34 @@ def calculate_field_statistics(numeric_values: List[float]) -> Dict[str, Any]:
     if not numeric_values:
         return {}
         
+    count = len(numeric_values)
+    total = sum(numeric_values)
+    average = total / count
+    
     stats = {
-        "count": len(numeric_values),
-        "sum": sum(numeric_values),
-        "average": sum(numeric_values) / len(numeric_values),
+        "count": count,
+        "sum": total,
+        "average": average,
         "min": min(numeric_values),
         "max": max(numeric_values),
     }
     
     # Add more statistics if more than one value
-    if len(numeric_values) > 1:
+    if count > 1:
+        mean = math.fsum(numeric_values) / count
+        variance = math.fsum((value - mean) ** 2 for value in numeric_values) / (count - 1)
+        
+        sorted_values = sorted(numeric_values)
+        middle = count // 2
+        if count % 2:
+            median = sorted_values[middle]
+        else:
+            median = (sorted_values[middle - 1] + sorted_values[middle]) / 2
+        
         stats.update({
-            "median": statistics.median(numeric_values),
-            "stddev": statistics.stdev(numeric_values),
-            "variance": statistics.variance(numeric_values)
+            "median": median,
+            "stddev": math.sqrt(variance),
+            "variance": variance
         })
         
     return stats
@@ -292,10 +375,21 @@ def calculate_aggregations(data: List[Dict[str, Any]], aggregation_fields: List[
         
     aggregated_data = {}
     
-    for field in aggregation_fields:
-        numeric_values = []
-        
-        for item in data:
+    # Collect every field's values in one pass over the rows instead of
+    # rescanning the data once per field
+    values_by_field = {field: [] for field in aggregation_fields}
+    
+    # Fields that no row contains can never yield values, so leave them
+    # out of the row loop
+    present_fields = set()
+    for item in data:
+        present_fields.update(item)
+    field_values = [(field, values) for field, values in values_by_field.items() if field in present_fields]
+    if not field_values:
+        return aggregated_data
+    
+    for item in data:
+        for field, numeric_values in field_values:
             if field in item:
                 value = item[field]
                 
@@ -308,7 +402,8 @@ def calculate_aggregations(data: List[Dict[str, Any]], aggregation_fields: List[
                 
                 if isinstance(value, (int, float)):
                     numeric_values.append(value)
-        
+    
+    for field, numeric_values in field_values:
         if numeric_values:
             aggregated_data[field] = calculate_field_statistics(numeric_values)
             
@@ -325,16 +420,17 @@ def compute_field_types(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]
     Returns:
         Dictionary with field types information
     """
-    field_types = {}
+    counts = Counter(chain.from_iterable(data))
     
+    first_types = {}
     for item in data:
-        for key, value in item.items():
-            if key not in field_types:
-                field_types[key] = {"type": type(value).__name__, "count": 1}
-            else:
-                field_types[key]["count"] += 1
+        new_keys = item.keys() - first_types.keys()
+        if new_keys:
+            for key, value in item.items():
+                if key in new_keys:
+                    first_types[key] = type(value).__name__
                 
-    return field_types
+    return {key: {"type": type_name, "count": counts[key]} for key, type_name in first_types.items()}
 
 
 def compute_overall_statistics(data: List[Dict[str, Any]], include_stats: bool) -> Dict[str, Any]:
@@ -374,8 +470,9 @@ def write_output_file(output_path: str, output_data: Dict[str, Any], output_form
         IOError: If an error occurs writing the file
     """
     if output_format.lower() == "json":
+        encoder = json.JSONEncoder(indent=2)
         with open(output_path, 'w') as out_file:
-            json.dump(output_data, out_file, indent=2)
+            out_file.writelines(encoder.iterencode(output_data))
     else:
         raise ValueError(f"Unsupported output format: {output_format}")
 
@@ -131,7 +131,7 @@ def create_sequence_processor():
         Returns:
             List containing func applied to each element
         """
-        return [func(item) for item in sequence]
+        return list(map(func, sequence))
     
     def filter_sequence(sequence, predicate):
         """
@@ -144,7 +144,7 @@ def create_sequence_processor():
         Returns:
             List containing elements for which predicate is True
         """
-        return [item for item in sequence if predicate(item)]
+        return list(filter(predicate, sequence))
     
     def reduce_sequence(sequence, func, initial=None):
         """
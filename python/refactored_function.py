@@ -9,11 +9,17 @@ function extraction and composition.
 import os
 import json
 import csv
+import functools
 import math
-import statistics
-from typing import List, Dict, Any, Optional, Union, Tuple
+from collections import Counter
+from itertools import chain
+from types import CodeType
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterator, Callable
 
 
+# Buffer size passed to open() for input files
+READ_BUFFER_SIZE = 1 << 20
+
 def validate_inputs(input_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate input parameters.
@@ -30,7 +36,10 @@ def validate_inputs(input_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
         "errors": []
     }
     
-    if not os.path.exists(input_path):
+    # Same outcome as os.path.exists, which also reports ValueError as missing
+    try:
+        os.stat(input_path)
+    except (OSError, ValueError):
         results["status"] = "error"
         results["errors"].append(f"Input file does not exist: {input_path}")
     
@@ -60,53 +69,127 @@ def extract_config_options(config: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def read_csv_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+def mapped_row_layout(header: List[str], mapping: Dict[str, str]) -> Tuple[List[str], List[int]]:
     """
-    Read and parse CSV file.
+    Work out the mapped keys of a row and the column each one comes from.
+    
+    Applying the mapping to the header once gives the same keys, in the
+    same order, as mapping every row built from that header.
+    
+    Args:
+        header: Column names of the input
+        mapping: Dictionary mapping old keys to new keys
+        
+    Returns:
+        Tuple of (mapped keys, source column index for each key)
+    """
+    # A repeated column name keeps its first position and its last value,
+    # as dict(zip(header, row)) would
+    positions = {}
+    for index, key in enumerate(header):
+        positions[key] = index
+        
+    layout = {}
+    for old_key, new_key in mapping.items():
+        if old_key in positions:
+            layout[new_key] = positions[old_key]
+            
+    for key, index in positions.items():
+        if key not in mapping:
+            layout[key] = index
+            
+    return list(layout), list(layout.values())
+
+
+def row_builder(header: List[str], mapping: Dict[str, str]) -> Callable[[List[str]], Dict[str, Any]]:
+    """
+    Create a function that builds a mapped item from a full row of values.
+    
+    Args:
+        header: Column names of the input
+        mapping: Dictionary mapping old keys to new keys
+        
+    Returns:
+        Function taking a row with one value per column
+    """
+    keys, indices = mapped_row_layout(header, mapping)
+    if indices == list(range(len(header))):
+        return lambda row: dict(zip(keys, row))
+    return lambda row: dict(zip(keys, map(row.__getitem__, indices)))
+
+
+def read_csv_file(file_path: str, mapping: Optional[Dict[str, str]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Read and parse CSV file, applying the column mapping as rows are built.
     
     Args:
         file_path: Path to CSV file
+        mapping: Optional dictionary mapping old keys to new keys
         
     Returns:
         Tuple of (data, warnings)
     """
     data = []
     warnings = []
-    
-    with open(file_path, 'r', newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
+    mapping = mapping or {}
+    
+    # The mapping is applied to the header once, so each row is built as a
+    # mapped dict straight from csv.reader
+    with open(file_path, 'r', newline='', buffering=READ_BUFFER_SIZE) as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return data, warnings
+        column_count = len(header)
+        build_row = row_builder(header, mapping)
+        
         for row in reader:
-            data.append(row)
+            if not row:
+                # DictReader skips blank lines
+                continue
+            if len(row) == column_count:
+                data.append(build_row(row))
+            else:
+                # Pad or collect irregular rows the way DictReader would
+                item = dict(zip(header, row))
+                if len(row) > column_count:
+                    item[None] = row[column_count:]
+                else:
+                    for key in header[len(row):]:
+                        item[key] = None
+                data.extend(apply_column_mapping([item], mapping))
             
     return data, warnings
 
 
-def read_json_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+def read_json_file(file_path: str, mapping: Optional[Dict[str, str]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
-    Read and parse JSON file.
+    Read and parse JSON file, applying the column mapping to each item.
     
     Args:
         file_path: Path to JSON file
+        mapping: Optional dictionary mapping old keys to new keys
         
     Returns:
         Tuple of (data, warnings)
     """
-    with open(file_path, 'r') as jsonfile:
+    with open(file_path, 'r', buffering=READ_BUFFER_SIZE) as jsonfile:
         data = json.load(jsonfile)
         
     # Ensure data is a list
     if not isinstance(data, list):
         data = [data]
         
-    return data, []
+    return apply_column_mapping(data, mapping or {}), []
 
 
-def read_txt_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+def read_txt_file(file_path: str, mapping: Optional[Dict[str, str]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
-    Read and parse TXT file.
+    Read and parse TXT file, applying the column mapping as rows are built.
     
     Args:
         file_path: Path to TXT file
+        mapping: Optional dictionary mapping old keys to new keys
         
     Returns:
         Tuple of (data, warnings)
@@ -114,26 +197,40 @@ def read_txt_file(file_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
     data = []
     warnings = []
     
-    with open(file_path, 'r') as txtfile:
-        lines = txtfile.readlines()
-        header = lines[0].strip().split(',')
-        for line in lines[1:]:
-            values = line.strip().split(',')
-            if len(values) == len(header):
-                row = {header[i]: values[i] for i in range(len(header))}
-                data.append(row)
+    with open(file_path, 'r', buffering=READ_BUFFER_SIZE) as txtfile:
+        header_line = txtfile.readline()
+        if not header_line:
+            raise ValueError("TXT file is empty")
+        header = header_line.strip().split(',')
+        column_count = len(header)
+        build_row = row_builder(header, mapping or {})
+        
+        for line in txtfile:
+            line = line.strip()
+            values = line.split(',')
+            if len(values) == column_count:
+                data.append(build_row(values))
             else:
-                warnings.append(f"Skipped malformed line: {line.strip()}")
+                warnings.append(f"Skipped malformed line: {line}")
                 
     return data, warnings
 
 
-def read_input_file(input_path: str) -> Tuple[List[Dict[str, Any]], str, List[str]]:
+# Reader function and reported file type for each supported extension
+FILE_READERS = {
+    '.csv': (read_csv_file, "csv"),
+    '.json': (read_json_file, "json"),
+    '.txt': (read_txt_file, "txt"),
+}
+
+
+def read_input_file(input_path: str, mapping: Optional[Dict[str, str]] = None) -> Tuple[List[Dict[str, Any]], str, List[str]]:
     """
     Read and parse input file based on extension.
     
     Args:
         input_path: Path to input file
+        mapping: Optional dictionary mapping old keys to new keys
         
     Returns:
         Tuple of (data, file_type, warnings)
@@ -142,41 +239,34 @@ def read_input_file(input_path: str) -> Tuple[List[Dict[str, Any]], str, List[st
     extension = extension.lower()
     
     try:
-        if extension == '.csv':
-            data, warnings = read_csv_file(input_path)
-            file_type = "csv"
-        elif extension == '.json':
-            data, warnings = read_json_file(input_path)
-            file_type = "json"
-        elif extension == '.txt':
-            data, warnings = read_txt_file(input_path)
-            file_type = "txt"
-        else:
+        if extension not in FILE_READERS:
             raise ValueError(f"Unsupported file extension: {extension}")
+        
+        reader, file_type = FILE_READERS[extension]
+        data, warnings = reader(input_path, mapping)
             
         return data, file_type, warnings
     except Exception as e:
         raise IOError(f"Error reading input file: {str(e)}")
 
 
-def apply_column_mapping(data: List[Dict[str, Any]], mapping: Dict[str, str]) -> List[Dict[str, Any]]:
+def iter_mapped_items(data: List[Dict[str, Any]], mapping: Dict[str, str]) -> Iterator[Dict[str, Any]]:
     """
-    Apply column mapping to data.
+    Lazily apply column mapping to data, one item at a time.
     
     Args:
         data: List of data dictionaries
         mapping: Dictionary mapping old keys to new keys
         
-    Returns:
-        List of mapped data dictionaries
+    Yields:
+        Mapped data dictionaries
     """
-    if not mapping:
-        return data
-        
-    mapped_data = []
+    # Snapshot the pairs once rather than re-creating the items view per row
+    mapping_items = tuple(mapping.items())
+    
     for item in data:
         mapped_item = {}
-        for old_key, new_key in mapping.items():
+        for old_key, new_key in mapping_items:
             if old_key in item:
                 mapped_item[new_key] = item[old_key]
         
@@ -185,9 +275,24 @@ def apply_column_mapping(data: List[Dict[str, Any]], mapping: Dict[str, str]) ->
             if k not in mapping:
                 mapped_item[k] = v
                 
-        mapped_data.append(mapped_item)
+        yield mapped_item
+
+
+def apply_column_mapping(data: List[Dict[str, Any]], mapping: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Apply column mapping to data.
+    
+    Args:
+        data: List of data dictionaries
+        mapping: Dictionary mapping old keys to new keys
+        
+    Returns:
+        List of mapped data dictionaries
+    """
+    if not mapping:
+        return data
         
-    return mapped_data
+    return list(iter_mapped_items(data, mapping))
 
 
 def convert_value_if_numeric(value: Any) -> Any:
@@ -200,55 +305,177 @@ def convert_value_if_numeric(value: Any) -> Any:
     Returns:
         Converted value or original value
     """
-    if not isinstance(value, str):
-        return value
-        
+    # Removing one '.' lets a single isdigit() accept ints and decimals
     try:
-        if value.isdigit() or (value.replace('.', '', 1).isdigit() and value.count('.') <= 1):
+        if isinstance(value, str) and value.replace('.', '', 1).isdigit():
             return float(value) if '.' in value else int(value)
     except ValueError:
         pass
-        
+    
     return value
 
 
-def check_filter_criteria(item: Dict[str, Any], filter_criteria: Dict[str, Any]) -> bool:
+# Rejection test emitted for each criteria operator, in the order they are
+# applied; {} is the name bound to the operand. Keys not listed here are
+# ignored, and a non-dict criterion is a plain equality check
+CRITERIA_REJECTIONS = (
+    ("eq", "value != {}"),
+    ("ne", "value == {}"),
+    ("gt", "not (isinstance(value, (int, float)) and value > {})"),
+    ("lt", "not (isinstance(value, (int, float)) and value < {})"),
+    ("in", "value not in {}"),
+    ("contains", "not (isinstance(value, str) and {} in value)"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_predicate_shape(shape: Tuple[Optional[Tuple[str, ...]], ...]) -> CodeType:
     """
-    Check if an item matches filter criteria.
+    Compile the predicate source for one shape of filter criteria.
+    
+    The shape lists, per field, the operators configured for it, or None
+    for a plain equality check. Field names and operands are referred to by
+    position (field_0, gt_0, expected_1, ...), so criteria that differ only
+    in their values share one compiled code object.
     
     Args:
-        item: Data item to check
-        filter_criteria: Filter criteria dictionary
+        shape: Operators per field, in the order the fields are checked
         
     Returns:
-        True if item matches criteria, False otherwise
+        Code object that defines predicate(item) when executed
     """
-    for field, criteria in filter_criteria.items():
-        if field not in item:
-            return False
+    lines = ["def predicate(item):"]
+    
+    for index, operators in enumerate(shape):
+        lines.append(f"    if field_{index} not in item:")
+        lines.append("        return False")
+        lines.append(f"    value = convert_value_if_numeric(item[field_{index}])")
+        
+        if operators is None:
+            rejections = [f"value != expected_{index}"]
+        else:
+            rejections = [
+                template.format(f"{operator}_{index}")
+                for operator, template in CRITERIA_REJECTIONS
+                if operator in operators
+            ]
+            
+        for rejection in rejections:
+            lines.append(f"    if {rejection}:")
+            lines.append("        return False")
             
-        value = convert_value_if_numeric(item[field])
+    lines.append("    return True")
+    
+    return compile("\n".join(lines), "<filter_criteria>", "exec")
+
+
+def compile_filter_criteria(filter_criteria: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile filter criteria into a predicate specialised for their shape.
+    
+    The criteria are inspected once and turned into a single function that
+    runs the configured comparisons as straight-line code, with no per-row
+    probing for operators or calls into per-criterion helpers. Field names
+    and operands are bound as globals of the generated function rather
+    than spliced into its source. An item matches when it has every field
+    and each field's value, converted by convert_value_if_numeric, passes
+    all of that field's criteria.
+    
+    Args:
+        filter_criteria: Filter criteria dictionary
+        
+    Returns:
+        Function returning True if an item matches the criteria
+    """
+    namespace = {"convert_value_if_numeric": convert_value_if_numeric}
+    shape = []
+    
+    for index, (field, criteria) in enumerate(filter_criteria.items()):
+        namespace[f"field_{index}"] = field
         
-        # Apply different types of criteria
         if isinstance(criteria, dict):
-            if "eq" in criteria and value != criteria["eq"]:
-                return False
-            if "ne" in criteria and value == criteria["ne"]:
-                return False
-            if "gt" in criteria and not (isinstance(value, (int, float)) and value > criteria["gt"]):
-                return False
-            if "lt" in criteria and not (isinstance(value, (int, float)) and value < criteria["lt"]):
-                return False
-            if "in" in criteria and value not in criteria["in"]:
-                return False
-            if "contains" in criteria and not (isinstance(value, str) and criteria["contains"] in value):
-                return False
+            operators = tuple(operator for operator, _ in CRITERIA_REJECTIONS if operator in criteria)
+            for operator in operators:
+                namespace[f"{operator}_{index}"] = criteria[operator]
         else:
             # Simple equality check
-            if value != criteria:
-                return False
-                
-    return True
+            operators = None
+            namespace[f"expected_{index}"] = criteria
+            
+        shape.append(operators)
+    
+    exec(compile_predicate_shape(tuple(shape)), namespace)
+    return namespace["predicate"]
+
+
+# Number of leading items used to estimate how selective each field's
+# criteria are
+SELECTIVITY_SAMPLE_SIZE = 1024
+
+# Smallest input worth estimating selectivity for; below this the sample
+# pass costs more than reordering saves
+REORDER_MIN_ITEMS = 4 * SELECTIVITY_SAMPLE_SIZE
+
+
+def filter_criteria_can_raise(filter_criteria: Dict[str, Any]) -> bool:
+    """
+    Check whether any criterion could raise on a plain data value.
+    
+    Values read from CSV, JSON or TXT input are strings, numbers, booleans,
+    None, lists or dicts. Equality tests never raise on them. Ordering
+    tests only compare numbers, so they are safe with a numeric bound.
+    Membership is safe in a list or tuple, and substring tests are safe
+    with a string operand. Anything else, such as 'in' a string or a set,
+    can raise TypeError on some values.
+    
+    Args:
+        filter_criteria: Filter criteria dictionary
+        
+    Returns:
+        True if some criterion could raise, False otherwise
+    """
+    for criteria in filter_criteria.values():
+        if not isinstance(criteria, dict):
+            continue
+        for operator in ("gt", "lt"):
+            if operator in criteria and not isinstance(criteria[operator], (int, float)):
+                return True
+        if "in" in criteria and not isinstance(criteria["in"], (list, tuple)):
+            return True
+        if "contains" in criteria and not isinstance(criteria["contains"], str):
+            return True
+            
+    return False
+
+
+def order_filter_criteria(filter_criteria: Dict[str, Any], sample: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reorder filter criteria so the most selective fields are checked first.
+    
+    Every field's criteria are tried on their own against the sample, and
+    fields that reject more sample items move to the front, so rejected
+    items are usually turned down by the first check. Ties keep their
+    original order. Since all criteria must hold, the order does not change
+    which items match. Criteria that could raise keep the given order,
+    since an earlier field may reject an item before a later comparison
+    would raise on it.
+    
+    Args:
+        filter_criteria: Filter criteria dictionary
+        sample: Items to estimate rejection rates on
+        
+    Returns:
+        Filter criteria dictionary in the order to check them
+    """
+    if len(filter_criteria) < 2 or not sample or filter_criteria_can_raise(filter_criteria):
+        return filter_criteria
+        
+    rejections = {}
+    for field, criteria in filter_criteria.items():
+        predicate = compile_filter_criteria({field: criteria})
+        rejections[field] = len(sample) - sum(map(predicate, sample))
+        
+    return dict(sorted(filter_criteria.items(), key=lambda kv: -rejections[kv[0]]))
 
 
 def apply_filtering(data: List[Dict[str, Any]], filter_criteria: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
@@ -265,10 +492,9 @@ def apply_filtering(data: List[Dict[str, Any]], filter_criteria: Dict[str, Any])
     if not filter_criteria:
         return data, {}
         
-    filtered_data = []
-    for item in data:
-        if check_filter_criteria(item, filter_criteria):
-            filtered_data.append(item)
+    if len(data) >= REORDER_MIN_ITEMS:
+        filter_criteria = order_filter_criteria(filter_criteria, data[:SELECTIVITY_SAMPLE_SIZE])
+    filtered_data = list(filter(compile_filter_criteria(filter_criteria), data))
             
     filter_stats = {
         "filtered_count": len(filtered_data),
@@ -278,34 +504,35 @@ def apply_filtering(data: List[Dict[str, Any]], filter_criteria: Dict[str, Any])
     return filtered_data, filter_stats
 
 
-def extract_numeric_values(data: List[Dict[str, Any]], field: str) -> List[float]:
+def extract_numeric_values(data: List[Dict[str, Any]], fields: List[str]) -> Dict[str, List[float]]:
     """
-    Extract numeric values for a field from data.
+    Extract numeric values for several fields from data in one pass.
     
     Args:
         data: List of data dictionaries
-        field: Field to extract values from
+        fields: Fields to extract values from
         
     Returns:
-        List of numeric values
+        Dictionary mapping each field to its list of numeric values
     """
-    numeric_values = []
+    columns = {field: [] for field in fields}
     
     for item in data:
-        if field in item:
-            value = item[field]
-            
-            # Try to convert string to number
-            if isinstance(value, str):
-                try:
-                    value = float(value) if '.' in value else int(value)
-                except ValueError:
-                    continue
-                    
-            if isinstance(value, (int, float)):
-                numeric_values.append(value)
+        for field, numeric_values in columns.items():
+            if field in item:
+                value = item[field]
                 
-    return numeric_values
+                # Try to convert string to number
+                if isinstance(value, str):
+                    try:
+                        value = float(value) if '.' in value else int(value)
+                    except ValueError:
+                        continue
+                        
+                if isinstance(value, (int, float)):
+                    numeric_values.append(value)
+                    
+    return columns
 
 
 def calculate_field_statistics(numeric_values: List[float]) -> Dict[str, Any]:
@@ -321,20 +548,35 @@ def calculate_field_statistics(numeric_values: List[float]) -> Dict[str, Any]:
     if not numeric_values:
         return {}
         
+    count = len(numeric_values)
+    total = sum(numeric_values)
+    average = total / count
+    
     stats = {
-        "count": len(numeric_values),
-        "sum": sum(numeric_values),
-        "average": sum(numeric_values) / len(numeric_values),
+        "count": count,
+        "sum": total,
+        "average": average,
         "min": min(numeric_values),
         "max": max(numeric_values),
     }
     
     # Add more statistics if more than one value
-    if len(numeric_values) > 1:
+    if count > 1:
+        # fsum keeps the squared deviations from piling up rounding error
+        mean = math.fsum(numeric_values) / count
+        variance = math.fsum((value - mean) ** 2 for value in numeric_values) / (count - 1)
+        
+        sorted_values = sorted(numeric_values)
+        middle = count // 2
+        if count % 2:
+            median = sorted_values[middle]
+        else:
+            median = (sorted_values[middle - 1] + sorted_values[middle]) / 2
+        
         stats.update({
-            "median": statistics.median(numeric_values),
-            "stddev": statistics.stdev(numeric_values),
-            "variance": statistics.variance(numeric_values)
+            "median": median,
+            "stddev": math.sqrt(variance),
+            "variance": variance
         })
         
     return stats
@@ -355,10 +597,9 @@ def calculate_aggregations(data: List[Dict[str, Any]], aggregation_fields: List[
         return {}
         
     aggregated_data = {}
+    columns = extract_numeric_values(data, aggregation_fields)
     
-    for field in aggregation_fields:
-        numeric_values = extract_numeric_values(data, field)
-        
+    for field, numeric_values in columns.items():
         if numeric_values:
             aggregated_data[field] = calculate_field_statistics(numeric_values)
             
@@ -375,16 +616,18 @@ def compute_field_types(data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]
     Returns:
         Dictionary with field types information
     """
-    field_types = {}
+    counts = Counter(chain.from_iterable(data))
     
+    # Only rows that bring new keys need their items walked
+    first_types = {}
     for item in data:
-        for key, value in item.items():
-            if key not in field_types:
-                field_types[key] = {"type": type(value).__name__, "count": 1}
-            else:
-                field_types[key]["count"] += 1
+        new_keys = item.keys() - first_types.keys()
+        if new_keys:
+            for key, value in item.items():
+                if key in new_keys:
+                    first_types[key] = type(value).__name__
                 
-    return field_types
+    return {key: {"type": type_name, "count": counts[key]} for key, type_name in first_types.items()}
 
 
 def compute_overall_statistics(data: List[Dict[str, Any]], include_stats: bool) -> Dict[str, Any]:
@@ -424,8 +667,10 @@ def write_output_file(output_path: str, output_data: Dict[str, Any], output_form
         IOError: If an error occurs writing the file
     """
     if output_format.lower() == "json":
+        # Write the encoded chunks as they are produced
+        encoder = json.JSONEncoder(indent=2)
         with open(output_path, 'w') as out_file:
-            json.dump(output_data, out_file, indent=2)
+            out_file.writelines(encoder.iterencode(output_data))
     else:
         raise ValueError(f"Unsupported output format: {output_format}")
 
@@ -470,14 +715,11 @@ def process_and_analyze_data(
     options = extract_config_options(config)
     
     try:
-        # Step 3: Read input file
-        data, file_type, warnings = read_input_file(input_path)
+        # Steps 3-4: Read input file, applying the column mapping
+        data, file_type, warnings = read_input_file(input_path, options["column_mapping"])
         results["file_type"] = file_type
         results["warnings"].extend(warnings)
         
-        # Step 4: Apply column mapping
-        data = apply_column_mapping(data, options["column_mapping"])
-        
         # Step 5: Apply filtering
         data, filter_stats = apply_filtering(data, options["filter_criteria"])
         results.update(filter_stats)
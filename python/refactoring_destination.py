@@ -8,9 +8,16 @@ to test DiffScope's ability to detect cross-file refactorings.
 import math
 import re
 import statistics
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Union, Tuple, Set, Callable
 
 
+# key=value pairs separated by semicolons, with optionally quoted values
+KEY_VALUE_PATTERN = re.compile(r'([^;=]+)=(?:"([^"]*)"|([^;]*))')
+
+# Digits with a single decimal point, i.e. the strings float() accepts
+# among those made up only of digits and dots
+DECIMAL_PATTERN = re.compile(r'\d+\.\d*|\.\d+')
+
 def process_data_enhanced(data: List[Dict[str, Any]], include_advanced_stats: bool = False) -> Dict[str, Any]:
     """
     Process a list of data dictionaries and compute statistics with enhanced features.
@@ -30,10 +37,26 @@ def process_data_enhanced(data: List[Dict[str, Any]], include_advanced_stats: bo
         numeric_values = []
         text_values = []
         boolean_values = []
+        keys_found = set()
+        
+        # Route the exact built-in types with one dict lookup instead of a
+        # chain of isinstance checks; bool is its own key, so it never
+        # lands with the ints
+        appenders = {
+            int: numeric_values.append,
+            float: numeric_values.append,
+            str: text_values.append,
+            bool: boolean_values.append,
+        }
         
         for item in data:
+            keys_found.update(item)
             for key, value in item.items():
-                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                append = appenders.get(type(value))
+                if append is not None:
+                    append(value)
+                # Subclasses of the types above still go through isinstance
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
                     numeric_values.append(value)
                 elif isinstance(value, str):
                     text_values.append(value)
@@ -44,7 +67,7 @@ def process_data_enhanced(data: List[Dict[str, Any]], include_advanced_stats: bo
         result = {
             "count": len(data),
             "has_data": len(data) > 0,
-            "keys_found": set().union(*(d.keys() for d in data)),
+            "keys_found": keys_found,
             "value_types": {
                 "numeric": len(numeric_values),
                 "text": len(text_values),
@@ -53,23 +76,31 @@ def process_data_enhanced(data: List[Dict[str, Any]], include_advanced_stats: bo
         }
         
         if numeric_values:
+            count = len(numeric_values)
+            total = sum(numeric_values)
+            
+            # Sort once up front; median() and quantiles() still sort their
+            # input, but that is a linear pass over an already sorted list
+            sorted_values = sorted(numeric_values)
+            
             result["numeric_stats"] = {
                 "min": min(numeric_values),
                 "max": max(numeric_values),
-                "mean": sum(numeric_values) / len(numeric_values),
-                "median": statistics.median(numeric_values),
-                "sum": sum(numeric_values),
-                "count": len(numeric_values)
+                "mean": total / count,
+                "median": statistics.median(sorted_values),
+                "sum": total,
+                "count": count
             }
             
-            if include_advanced_stats and len(numeric_values) > 1:
+            if include_advanced_stats and count > 1:
+                q1, q2, q3 = statistics.quantiles(sorted_values, n=4)
                 result["numeric_stats"].update({
                     "stddev": statistics.stdev(numeric_values),
                     "variance": statistics.variance(numeric_values),
                     "quartiles": {
-                        "q1": statistics.quantiles(numeric_values, n=4)[0],
-                        "q2": statistics.quantiles(numeric_values, n=4)[1],
-                        "q3": statistics.quantiles(numeric_values, n=4)[2]
+                        "q1": q1,
+                        "q2": q2,
+                        "q3": q3
                     }
                 })
         
@@ -109,39 +140,58 @@ def transform_data_structure(
         Transformed data structure
     """
     # Handle the case of list of dictionaries
-    if isinstance(data, list):
+    if isinstance(data, list) and recursive:
         return [transform_data_structure(item, mapping, recursive, filter_keys) 
                 for item in data if isinstance(item, dict)]
     
+    mapping_items = tuple(mapping.items())
+    kept_keys = set(filter_keys) if filter_keys else None
+    
+    if isinstance(data, list):
+        # Without recursion each item is a plain rename, so skip the full
+        # call per item and reuse the hoisted pairs and key set
+        return [_rename_and_filter(item, mapping, mapping_items, kept_keys)
+                for item in data if isinstance(item, dict)]
+    
     # Now data is guaranteed to be a dictionary
+    transform_value = None
+    if recursive:
+        def transform_value(value):
+            # Apply recursive transformation to nested structures
+            if isinstance(value, (dict, list)):
+                return transform_data_structure(value, mapping, recursive, filter_keys)
+            return value
+    
+    return _rename_and_filter(data, mapping, mapping_items, kept_keys, transform_value)
+
+
+def _rename_and_filter(
+    item: Dict[str, Any],
+    mapping: Dict[str, str],
+    mapping_items: Tuple[Tuple[str, str], ...],
+    kept_keys: Optional[Set[str]],
+    transform_value: Optional[Callable[[Any], Any]] = None
+) -> Dict[str, Any]:
+    """Rename one dictionary's keys, transform its values and keep only kept_keys."""
     result = {}
     
-    for old_key, new_key in mapping.items():
-        if old_key in data:
-            value = data[old_key]
-            
-            # Apply recursive transformation if needed
-            if recursive and isinstance(value, dict):
-                value = transform_data_structure(value, mapping, recursive, filter_keys)
-            elif recursive and isinstance(value, list):
-                value = transform_data_structure(value, mapping, recursive, filter_keys)
-                
+    for old_key, new_key in mapping_items:
+        if old_key in item:
+            value = item[old_key]
+            if transform_value is not None:
+                value = transform_value(value)
             result[new_key] = value
     
     # Include any keys not in the mapping
-    for key, value in data.items():
+    for key, value in item.items():
         if key not in mapping:
-            # Apply recursive transformation if needed
-            if recursive and isinstance(value, dict):
-                value = transform_data_structure(value, mapping, recursive, filter_keys)
-            elif recursive and isinstance(value, list):
-                value = transform_data_structure(value, mapping, recursive, filter_keys)
-                
+            if transform_value is not None:
+                value = transform_value(value)
             result[key] = value
     
     # Filter keys if specified
-    if filter_keys:
-        result = {k: v for k, v in result.items() if k in filter_keys}
+    if kept_keys is not None:
+        result = {k: v for k, v in result.items() if k in kept_keys}
     
     return result
 
@@ -162,24 +212,28 @@ def parse_structured_data(text: str, format_type: str = "key_value") -> Dict[str
     
     if format_type == "key_value":
         # Split by semicolons, but respect quoted values
-        pairs = re.findall(r'([^;=]+)=(?:"([^"]*)"|([^;]*))', text)
+        pairs = KEY_VALUE_PATTERN.findall(text)
         
         result = {}
         for key, quoted_val, unquoted_val in pairs:
             key = key.strip()
             value = quoted_val if quoted_val else unquoted_val.strip()
             
-            # Try to convert to appropriate type
+            # Try to convert to appropriate type; the checks only let through
+            # strings that float() and int() accept, so malformed numbers
+            # such as "1.2.3" no longer go through a raised ValueError
+            lowered = value.lower()
             try:
-                if value.lower() == 'true':
+                if lowered == 'true':
                     value = True
-                elif value.lower() == 'false':
+                elif lowered == 'false':
                     value = False
-                elif '.' in value and value.replace('.', '').isdigit():
+                elif DECIMAL_PATTERN.fullmatch(value):
                     value = float(value)
-                elif value.isdigit():
+                elif value.isdecimal():
                     value = int(value)
-            except (ValueError, AttributeError):
+            except ValueError:
+                # int() still rejects digit strings past the conversion limit
                 pass
             
             result[key] = value
@@ -53,6 +53,11 @@ def enhanced_data_processor(data, min_threshold=0.5, max_threshold=1.0, config=N
     Returns:
         Processed data
     """
+    # Without a config there is nothing to log, so filter and scale in a
+    # single comprehension instead of appending item by item
+    if not config:
+        return [item * 2 for item in data if min_threshold <= item <= max_threshold]
+    
     result = []
     
     for item in data:
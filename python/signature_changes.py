@@ -20,14 +20,8 @@ def function_for_param_addition(a, b, c=0, d=None, **kwargs):
     Returns:
         Sum of parameters and count of kwargs
     """
-    result = a + b
-    if c:
-        result += c
-    
-    # Count the kwargs
-    kwargs_count = len(kwargs)
-    
-    return result + kwargs_count
+    # Add c only when it is set, then the count of kwargs
+    return (a + b + c if c else a + b) + len(kwargs)
 
 
 def function_for_param_removal(a, b):
@@ -117,12 +111,7 @@ def function_with_multiple_signature_changes(a, b, c=None):
     Returns:
         Dictionary containing parameter values
     """
-    result = {
-        "a": a,
-        "b": b
-    }
-    
-    if c is not None:
-        result["c"] = c
-        
-    return result 
\ No newline at end of file
+    # Build each shape as one literal instead of inserting c afterwards
+    if c is None:
+        return {"a": a, "b": b}
+    return {"a": a, "b": b, "c": c} 
\ No newline at end of file